@@ -1,8 +1,27 @@
 from setuptools import find_packages, setup
+import os
+import warnings
 
 with open("README.md", encoding="utf-8") as f:
     long_description = f.read()
 
+# Modules on the per-request hot path that can optionally be compiled with Cython.
+# The pure Python sources are always shipped and used whenever no compiled module is present.
+CYTHON_MODULES = ["src/floki/llm/utils/request.py"]
+
+def get_ext_modules():
+    """Compile hot-path modules with Cython when FLOKI_CYTHONIZE=1 is set and Cython is available."""
+    if os.environ.get("FLOKI_CYTHONIZE") != "1":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn("FLOKI_CYTHONIZE is set but Cython is not installed. Skipping compiled modules.")
+        return []
+    # Keep type hints as documentation only and keep Python-level function introspection,
+    # so the compiled module accepts the same inputs as the pure Python one
+    return cythonize(CYTHON_MODULES, compiler_directives={"language_level": 3, "annotation_typing": False, "binding": True})
+
 setup(
     name="floki-ai",
     version="0.10.1",
@@ -19,6 +38,7 @@ setup(
     keywords="LLM Cybersecurity AI Agents",
     package_dir={'': 'src'},
     packages=find_packages(where="src"),
+    ext_modules=get_ext_modules(),
     install_requires=[
         "pydantic==2.10.5",
         "openai==1.59.6",
@@ -1,5 +1,6 @@
 from floki.llm.huggingface.client import HFHubInferenceClientBase
-from floki.llm.utils import RequestHandler, ResponseHandler
+from floki.llm.utils.request import normalize_chat_messages, process_params
+from floki.llm.utils import ResponseHandler
 from floki.prompt.prompty import Prompty
 from floki.types.message import BaseMessage
 from floki.llm.chat import ChatClientBase
@@ -97,7 +98,7 @@ class HFHubChatClient(HFHubInferenceClientBase, ChatClientBase):
             raise ValueError("Either 'messages' or 'input_data' must be provided.")
 
         # Process and normalize the messages
-        params = {'messages': RequestHandler.normalize_chat_messages(messages)}
+        params = {'messages': normalize_chat_messages(messages)}
 
         # Merge Prompty parameters if available, then override with any explicit kwargs
         if self.prompty:
@@ -109,7 +110,7 @@ class HFHubChatClient(HFHubInferenceClientBase, ChatClientBase):
         params['model'] = model or self.model
 
         # Prepare and send the request
-        params = RequestHandler.process_params(params, llm_provider=self.provider, tools=tools, response_model=response_model)
+        params = process_params(params, llm_provider=self.provider, tools=tools, response_model=response_model)
 
         try:
             logger.info("Invoking Hugging Face ChatCompletion API.")
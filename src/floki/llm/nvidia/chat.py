@@ -1,4 +1,5 @@
-from floki.llm.utils import RequestHandler, ResponseHandler
+from floki.llm.utils.request import normalize_chat_messages, process_params
+from floki.llm.utils import ResponseHandler
 from floki.llm.nvidia.client import NVIDIAClientBase
 from floki.types.message import BaseMessage
 from floki.llm.chat import ChatClientBase
@@ -101,7 +102,7 @@ class NVIDIAChatClient(NVIDIAClientBase, ChatClientBase):
             raise ValueError("Either 'messages' or 'input_data' must be provided.")
 
         # Process and normalize the messages
-        params = {'messages': RequestHandler.normalize_chat_messages(messages)}
+        params = {'messages': normalize_chat_messages(messages)}
 
         # Merge prompty parameters if available, then override with any explicit kwargs
         if self.prompty:
@@ -116,7 +117,7 @@ class NVIDIAChatClient(NVIDIAClientBase, ChatClientBase):
         params['max_tokens'] = max_tokens or self.max_tokens
 
         # Prepare and send the request
-        params = RequestHandler.process_params(params, llm_provider=self.provider, tools=tools, response_model=response_model)
+        params = process_params(params, llm_provider=self.provider, tools=tools, response_model=response_model)
 
         try:
             logger.info("Invoking ChatCompletion API.")
@@ -1,5 +1,5 @@
 from floki.llm.openai.client.base import OpenAIClientBase
-from floki.llm.utils import RequestHandler
+from floki.llm.utils.request import validate_request
 from floki.types.llm import (
     AudioSpeechRequest, AudioTranscriptionRequest,
     AudioTranslationRequest, AudioTranscriptionResponse, AudioTranslationResponse,
@@ -34,7 +34,7 @@ class OpenAIAudioClient(OpenAIClientBase):
             Union[bytes, None]: The generated audio content as bytes if no file_name is provided, otherwise None.
         """
         # Transform dictionary to Pydantic object if needed
-        validated_request: AudioSpeechRequest = RequestHandler.validate_request(request, AudioSpeechRequest)
+        validated_request: AudioSpeechRequest = validate_request(request, AudioSpeechRequest)
 
         logger.info(f"Using model '{validated_request.model}' for speech generation.")
 
@@ -93,7 +93,7 @@ class OpenAIAudioClient(OpenAIClientBase):
         Returns:
             AudioTranscriptionResponse: The transcription result.
         """
-        validated_request: AudioTranscriptionRequest = RequestHandler.validate_request(request, AudioTranscriptionRequest)
+        validated_request: AudioTranscriptionRequest = validate_request(request, AudioTranscriptionRequest)
 
         logger.info(f"Using model '{validated_request.model}' for transcription.")
 
@@ -113,7 +113,7 @@ class OpenAIAudioClient(OpenAIClientBase):
         Returns:
             AudioTranslationResponse: The translation result.
         """
-        validated_request: AudioTranslationRequest = RequestHandler.validate_request(request, AudioTranslationRequest)
+        validated_request: AudioTranslationRequest = validate_request(request, AudioTranslationRequest)
 
         logger.info(f"Using model '{validated_request.model}' for translation.")
 
@@ -1,129 +1,241 @@
-from typing import Dict, Any, Optional, List, Type, Union, Iterable
+from typing import Dict, Any, Optional, List, Type, Union, Iterable, Tuple, get_args
 from floki.prompt.prompty import Prompty, PromptyHelper
 from floki.types.message import BaseMessage
 from floki.llm.utils import StructureHandler
-from floki.tool.utils.tool import ToolHelper
+from floki.tool.utils.tool import ToolHelper, FormattedTools
 from pydantic import BaseModel, ValidationError
+from functools import lru_cache
+from collections import deque
 
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
-class RequestHandler:
+def _holds_model(annotation: Any) -> bool:
     """
-    Handles the preparation of requests for language models.
+    Check whether a field annotation can hold a Pydantic model, including inside containers or unions.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_holds_model(arg) for arg in get_args(annotation))
+
+# Flatness of each message class, keyed weakly so dynamically created classes can be released
+_FLAT_MESSAGE_CLASSES = weakref.WeakKeyDictionary()
+
+def _is_flat_message(message_class: Type[BaseMessage]) -> bool:
+    """
+    Determine once per message class whether its serialization is a plain copy of its fields.
+    Classes holding nested models, excluded fields, custom serializers or computed fields are not flat.
+    Instances of flat classes can be copied from their `__dict__` without a serializer walk.
+    """
+    is_flat = _FLAT_MESSAGE_CLASSES.get(message_class)
+    if is_flat is None:
+        decorators = message_class.__pydantic_decorators__
+        is_flat = _FLAT_MESSAGE_CLASSES[message_class] = not (
+            message_class.model_config.get("extra") == "allow"
+            or message_class.__pydantic_computed_fields__
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or any(field.exclude or _holds_model(field.annotation) for field in message_class.model_fields.values())
+        )
+    return is_flat
+
+def _dump_message(msg: BaseMessage) -> Dict[str, Any]:
+    """
+    Convert a BaseMessage into a dictionary, skipping Pydantic serialization for flat message classes.
+    """
+    message_class = type(msg)
+    if _is_flat_message(message_class):
+        return dict(msg.__dict__)
+    return message_class.__pydantic_serializer__.to_python(msg)
+
+@lru_cache(maxsize=512)
+def _render_prompty(content: str, api_type: str, frozen_inputs: Tuple[Tuple[str, type, Any], ...]) -> Union[str, Tuple[BaseMessage, ...]]:
+    """
+    Render Prompty content for a set of scalar inputs, memoizing the result for repeated requests.
+    """
+    inputs = {key: value for key, _, value in frozen_inputs}
+    messages = PromptyHelper.to_prompt(content, inputs, api_type=api_type)
+    return messages if isinstance(messages, str) else tuple(messages)
+
+# Exact input types safe to cache on; containers may nest values that compare equal but render differently
+_CACHEABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+def _freeze_inputs(inputs: Dict[str, Any]) -> Optional[Tuple[Tuple[str, type, Any], ...]]:
+    """
+    Build a cache key from prepared Prompty inputs, or return None if any value is not an exact scalar type.
+    Value types are part of the key so that equal values such as 1, 1.0 and True are not conflated.
     """
+    if not all(type(value) in _CACHEABLE_TYPES for value in inputs.values()):
+        return None
+    return tuple(sorted(((key, type(value), value) for key, value in inputs.items()), key=lambda item: str(item[0])))
 
-    @staticmethod
-    def process_prompty_messages(prompty: Prompty, inputs: Dict[str, Any] = {}) -> List[Dict[str, Any]]:
-        """
-        Process and format messages based on Prompty template and provided inputs.
+_VALID_ROLES = frozenset({"user", "assistant", "tool", "system"})
 
-        Args:
-            prompty (Prompty): The Prompty instance containing the template and settings.
-            inputs (Dict[str, Any]): Input variables for the Prompty template (default is an empty dictionary).
+def _normalize_str(msg: str) -> Dict[str, Any]:
+    """
+    Wrap a plain string as a user message.
+    """
+    return {"role": "user", "content": msg}
+
+def _normalize_dict(msg: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate the role of a message dictionary and return it unchanged.
+    """
+    role = msg.get("role")
+    if role not in _VALID_ROLES:
+        raise ValueError(f"Unrecognized role '{role}'. Supported roles are 'user', 'assistant', 'tool', or 'system'.")
+    return msg
 
-        Returns:
-            List[Dict[str, Any]]: Processed and prepared messages.
-        """
-        # Prepare inputs and generate messages from Prompty content
-        api_type = prompty.model.api
-        prepared_inputs = PromptyHelper.prepare_inputs(inputs, prompty.inputs, prompty.sample)
-        messages = PromptyHelper.to_prompt(prompty.content, prepared_inputs, api_type=api_type)
+# Exact-type handlers for the most common message formats
+_NORMALIZERS = {str: _normalize_str, dict: _normalize_dict}
+
+# Container types expanded without the slower Iterable ABC check
+_ITERABLE_TYPES = (list, tuple)
+
+def process_prompty_messages(prompty: Prompty, inputs: Dict[str, Any] = {}) -> List[Dict[str, Any]]:
+    """
+    Process and format messages based on Prompty template and provided inputs.
+
+    Args:
+        prompty (Prompty): The Prompty instance containing the template and settings.
+        inputs (Dict[str, Any]): Input variables for the Prompty template (default is an empty dictionary).
+
+    Returns:
+        List[Dict[str, Any]]: Processed and prepared messages.
+    """
+    # Prepare inputs and generate messages from Prompty content
+    api_type = prompty.model.api
+    prepared_inputs = PromptyHelper.prepare_inputs(inputs, prompty.inputs, prompty.sample)
 
+    frozen_inputs = _freeze_inputs(prepared_inputs)
+    if frozen_inputs is None:
+        return PromptyHelper.to_prompt(prompty.content, prepared_inputs, api_type=api_type)
+
+    # Reuse rendered messages for repeated inputs, copying them so callers cannot alter the cache
+    messages = _render_prompty(prompty.content, api_type, frozen_inputs)
+    if isinstance(messages, str):
         return messages
-    
-    @staticmethod
-    def normalize_chat_messages(messages: Union[str, Dict[str, Any], BaseMessage, Iterable[Union[Dict[str, Any], BaseMessage]]]) -> List[Dict[str, Any]]:
-        """
-        Normalize and validate the input messages into a list of dictionaries.
-
-        Args:
-            messages (Union[str, Dict[str, Any], BaseMessage, Iterable[Union[Dict[str, Any], BaseMessage]]]): 
-                Input messages in various formats (string, dict, BaseMessage, or an iterable).
-
-        Returns:
-            List[Dict[str, Any]]: A list of normalized message dictionaries with keys 'role' and 'content'.
-
-        Raises:
-            ValueError: If the input format is unsupported or if required fields are missing in a dictionary.
-        """
-        # Initialize an empty list to store the normalized messages
-        normalized_messages = []
-
-        # Use a queue to process messages iteratively and handle nested structures
-        queue = [messages]
-
-        while queue:
-            msg = queue.pop(0)
-            if isinstance(msg, str):
-                normalized_messages.append({"role": "user", "content": msg})
-            elif isinstance(msg, BaseMessage):
-                normalized_messages.append(msg.model_dump())
-            elif isinstance(msg, dict):
-                role = msg.get("role")
-                if role not in {"user", "assistant", "tool", "system"}:
-                    raise ValueError(f"Unrecognized role '{role}'. Supported roles are 'user', 'assistant', 'tool', or 'system'.")
-                normalized_messages.append(msg)
-            elif isinstance(msg, Iterable) and not isinstance(msg, (str, dict)):
-                queue.extend(msg)
-            else:
-                raise ValueError(f"Unsupported message format: {type(msg)}")
-        return normalized_messages
-    
-    @staticmethod
-    def process_params(
-        params: Dict[str, Any],
-        llm_provider: str,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        response_model: Optional[Type[BaseModel]] = None,
-    ) -> Dict[str, Any]:
-        """
-        Prepare request parameters for the language model.
-
-        Args:
-            params: Parameters for the request.
-            llm_provider: The LLM provider to use (e.g., 'openai').
-            tools: List of tools to include in the request.
-            response_model: A pydantic model to parse and validate the structured response.
-
-        Returns:
-            Dict[str, Any]: Prepared request parameters.
-        """
-        if tools:
-            logger.info("Tools are available in the request.")
-            params['tools'] = [ToolHelper.format_tool(tool, tool_format=llm_provider) for tool in tools]
-
-        if response_model:
-            logger.info("A response model has been passed to structure the response of the LLM.")
-            params = StructureHandler.generate_request(response_model=response_model, llm_provider=llm_provider, **params)
-        
-        return params
-    
-    @staticmethod
-    def validate_request(request: Union[BaseModel, Dict[str, Any]], request_class: Type[BaseModel]) -> BaseModel:
-        """
-        Validate and transform a dictionary into a Pydantic object.
-
-        Args:
-            request (Union[BaseModel, Dict[str, Any]]): The request data as a dictionary or a Pydantic object.
-            request_class (Type[BaseModel]): The Pydantic model class for validation.
-
-        Returns:
-            BaseModel: A validated Pydantic object.
-
-        Raises:
-            ValueError: If validation fails.
-        """
-        if isinstance(request, dict):
+    return [message.model_copy() for message in messages]
+
+def normalize_chat_messages(messages: Union[str, Dict[str, Any], BaseMessage, Iterable[Union[Dict[str, Any], BaseMessage]]]) -> List[Dict[str, Any]]:
+    """
+    Normalize and validate the input messages into a list of dictionaries.
+
+    Args:
+        messages (Union[str, Dict[str, Any], BaseMessage, Iterable[Union[Dict[str, Any], BaseMessage]]]): 
+            Input messages in various formats (string, dict, BaseMessage, or an iterable).
+
+    Returns:
+        List[Dict[str, Any]]: A list of normalized message dictionaries with keys 'role' and 'content'.
+
+    Raises:
+        ValueError: If the input format is unsupported or if required fields are missing in a dictionary.
+    """
+    # Fast path for the common case of a flat list of message dictionaries
+    if type(messages) is list:
+        for msg in messages:
+            if type(msg) is not dict:
+                break
+            _normalize_dict(msg)
+        else:
+            return list(messages)
+
+    # Initialize an empty list to store the normalized messages
+    normalized_messages = []
+
+    # Use a queue to process messages iteratively and handle nested structures
+    queue = deque([messages])
+
+    while queue:
+        msg = queue.popleft()
+        msg_type = type(msg)
+        normalizer = _NORMALIZERS.get(msg_type)
+        if normalizer is not None:
+            normalized_messages.append(normalizer(msg))
+        elif msg_type in _ITERABLE_TYPES:
+            queue.extend(msg)
+        elif isinstance(msg, BaseMessage):
+            normalized_messages.append(_dump_message(msg))
+        elif issubclass(msg_type, str):
+            normalized_messages.append(_normalize_str(msg))
+        elif issubclass(msg_type, dict):
+            normalized_messages.append(_normalize_dict(msg))
+        else:
+            # Strings and dicts were handled above, so any remaining iterable is a nested batch
             try:
-                request = request_class(**request)
-            except ValidationError as e:
-                raise ValueError(f"Validation error: {e}")
+                nested_messages = iter(msg)
+            except TypeError:
+                raise ValueError(f"Unsupported message format: {msg_type}")
+            queue.extend(nested_messages)
+    return normalized_messages
+
+def process_params(
+    params: Dict[str, Any],
+    llm_provider: str,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    response_model: Optional[Type[BaseModel]] = None,
+) -> Dict[str, Any]:
+    """
+    Prepare request parameters for the language model.
+
+    Args:
+        params: Parameters for the request.
+        llm_provider: The LLM provider to use (e.g., 'openai').
+        tools: List of tools to include in the request. Tools from `ToolHelper.format_tools` for the same provider are used as-is.
+        response_model: A pydantic model to parse and validate the structured response.
+
+    Returns:
+        Dict[str, Any]: Prepared request parameters.
+    """
+    if tools:
+        logger.debug("Tools are available in the request.")
+        if isinstance(tools, FormattedTools) and tools.tool_format == llm_provider:
+            params['tools'] = tools
+        else:
+            formatter = ToolHelper.get_formatter(llm_provider)
+            params['tools'] = list(map(formatter, tools))
+
+    if response_model:
+        logger.debug("A response model has been passed to structure the response of the LLM.")
+        params = StructureHandler.generate_request(response_model=response_model, llm_provider=llm_provider, **params)
+
+    return params
 
+def validate_request(request: Union[BaseModel, Dict[str, Any]], request_class: Type[BaseModel]) -> BaseModel:
+    """
+    Validate and transform a dictionary into a Pydantic object.
+
+    Args:
+        request (Union[BaseModel, Dict[str, Any]]): The request data as a dictionary or a Pydantic object.
+        request_class (Type[BaseModel]): The Pydantic model class for validation.
+
+    Returns:
+        BaseModel: A validated Pydantic object.
+
+    Raises:
+        ValueError: If validation fails.
+    """
+    if isinstance(request, dict):
         try:
-            validated_request = request_class.model_validate(request)
+            request = request_class(**request)
         except ValidationError as e:
             raise ValueError(f"Validation error: {e}")
-        
-        return validated_request
\ No newline at end of file
+
+    try:
+        validated_request = request_class.model_validate(request)
+    except ValidationError as e:
+        raise ValueError(f"Validation error: {e}")
+
+    return validated_request
+
+class RequestHandler:
+    """
+    Handles the preparation of requests for language models.
+    The methods are aliases of the module-level functions, kept for backward compatibility.
+    """
+    process_prompty_messages = staticmethod(process_prompty_messages)
+    normalize_chat_messages = staticmethod(normalize_chat_messages)
+    process_params = staticmethod(process_params)
+    validate_request = staticmethod(validate_request)
\ No newline at end of file
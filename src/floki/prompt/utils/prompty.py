@@ -12,6 +12,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader for parsing frontmatter, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+_FRONTMATTER_PATTERN = re.compile(r"-{3,}\n(.*?)\n-{3,}\n(.*)", re.DOTALL)
+
 class RoleMap:
     """
     A utility class to map roles to message types.
@@ -63,13 +71,12 @@ class PromptyHelper:
         else:
             content = prompty_source  # Treat as inline content
 
-        pattern = r"-{3,}\n(.*?)\n-{3,}\n(.*)"
-        match = re.search(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_PATTERN.search(content)
 
         if match:
             yaml_frontmatter = match.group(1)
             markdown_content = match.group(2)
-            yaml_metadata = yaml.safe_load(yaml_frontmatter)
+            yaml_metadata = yaml.load(yaml_frontmatter, Loader=_YamlSafeLoader)
             return yaml_metadata, markdown_content
         else:
             raise ValueError("Invalid Prompty content format: could not extract frontmatter.")
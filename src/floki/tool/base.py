@@ -1,10 +1,11 @@
 from floki.tool.utils.function_calling import to_function_call_definition
-from pydantic import BaseModel, Field, ValidationError, model_validator
-from typing import Callable, Type, Optional, Any, Dict
+from pydantic import BaseModel, Field, ValidationError, model_validator, PrivateAttr
+from typing import Callable, Type, Optional, Any, Dict, Tuple
 from floki.tool.utils.tool import ToolHelper
 from inspect import signature, Parameter
 from floki.types import ToolError
 import logging
+import copy
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,8 @@ class AgentTool(BaseModel):
     args_model: Optional[Type[BaseModel]] = Field(None, description="Pydantic model for validating tool arguments.")
     func: Optional[Callable] = Field(None, description="Optional function implementing the tool's behavior.")
 
+    _function_call_cache: Dict[Tuple, Dict] = PrivateAttr(default_factory=dict)
+
     @model_validator(mode='before')
     @classmethod
     def set_name_and_description(cls, values: dict) -> dict:
@@ -164,7 +167,13 @@ class AgentTool(BaseModel):
         Returns:
             Dict: The function call representation.
         """
-        return to_function_call_definition(self.name, self.description, self.args_model, format_type, use_deprecated)
+        # The definition only depends on these values, so it is generated once per combination
+        cache_key = (format_type, use_deprecated, self.name, self.description, self.args_model)
+        function_call = self._function_call_cache.get(cache_key)
+        if function_call is None:
+            function_call = to_function_call_definition(self.name, self.description, self.args_model, format_type, use_deprecated)
+            self._function_call_cache[cache_key] = function_call
+        return copy.deepcopy(function_call)
 
     def __repr__(self) -> str:
         """Returns a string representation of the AgentTool."""
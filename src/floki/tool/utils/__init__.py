@@ -1,2 +1,2 @@
 from .openapi import OpenAPISpecParser
-from .tool import ToolHelper
\ No newline at end of file
+from .tool import ToolHelper, FormattedTools
\ No newline at end of file
@@ -1,12 +1,34 @@
 from floki.tool.utils.function_calling import validate_and_format_tool
-from typing import Any, Union, Dict, Callable, Optional, Type
+from typing import Any, Union, Dict, Callable, Optional, Type, Iterable
 from inspect import signature, Parameter
+from functools import lru_cache, partial
 from pydantic import BaseModel, create_model, Field
 from floki.types import ToolError
 import logging
+import weakref
+import copy
 
 logger = logging.getLogger(__name__)
 
+# Formatted definitions of plain functions, keyed weakly on the function. The cached values
+# hold no reference back to the function, so entries are dropped once it is garbage-collected.
+_FUNCTION_FORMATS = weakref.WeakKeyDictionary()
+
+class FormattedTools(list):
+    """
+    A list of tools already formatted for a specific API format.
+    Request preparation passes it through as-is when the format matches, skipping per-tool formatting.
+    Create it with `ToolHelper.format_tools` rather than tagging unformatted tools by hand.
+
+    Attributes:
+        tool_format (str): The API format the tools were formatted for, e.g., 'openai'.
+    """
+    __slots__ = ('tool_format',)
+
+    def __init__(self, tools: Iterable[dict], tool_format: str):
+        super().__init__(tools)
+        self.tool_format = tool_format
+
 class ToolHelper:
     """
     Utility class for common operations related to agent tools, such as validating docstrings,
@@ -42,13 +64,62 @@ class ToolHelper:
         """
         from floki.tool.base import AgentTool
         if callable(tool) and not isinstance(tool, AgentTool):
-            tool = AgentTool.from_func(tool)
+            return ToolHelper._format_function(tool, tool_format, use_deprecated)
         elif isinstance(tool, dict):
             return validate_and_format_tool(tool, tool_format, use_deprecated)
         if not isinstance(tool, AgentTool):
             raise TypeError(f"Unsupported tool type: {type(tool).__name__}")
         return tool.to_function_call(format_type=tool_format, use_deprecated=use_deprecated)
     
+    @staticmethod
+    def _format_function(func: Callable, tool_format: str, use_deprecated: bool) -> dict:
+        """
+        Formats a plain function as a tool, reusing its formatted definition across requests.
+        Functions that cannot be weakly referenced are formatted on every call.
+        """
+        from floki.tool.base import AgentTool
+        try:
+            formats = _FUNCTION_FORMATS.get(func)
+        except TypeError:
+            return AgentTool.from_func(func).to_function_call(format_type=tool_format, use_deprecated=use_deprecated)
+        if formats is None:
+            formats = _FUNCTION_FORMATS[func] = {}
+        cache_key = (tool_format, use_deprecated)
+        if cache_key not in formats:
+            formats[cache_key] = AgentTool.from_func(func).to_function_call(format_type=tool_format, use_deprecated=use_deprecated)
+        return copy.deepcopy(formats[cache_key])
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_formatter(tool_format: str = 'openai', use_deprecated: bool = False) -> Callable[[Union[Dict[str, Any], Callable]], dict]:
+        """
+        Resolves a tool formatter bound to a specific API format, so it can be applied to many tools.
+        
+        Args:
+            tool_format (str): Format type, e.g., 'openai'.
+            use_deprecated (bool): Set to use a deprecated format.
+
+        Returns:
+            Callable[[Union[Dict[str, Any], Callable]], dict]: A function formatting a single tool.
+        """
+        return partial(ToolHelper.format_tool, tool_format=tool_format, use_deprecated=use_deprecated)
+    
+    @staticmethod
+    def format_tools(tools: Iterable[Union[Dict[str, Any], Callable]], tool_format: str = 'openai') -> FormattedTools:
+        """
+        Formats a set of tools once, so the result can be reused across requests without reformatting.
+        
+        Args:
+            tools (Iterable[Union[Dict[str, Any], Callable]]): The tools to format.
+            tool_format (str): Format type, e.g., 'openai'.
+
+        Returns:
+            FormattedTools: The formatted tools, tagged with their format.
+        """
+        if isinstance(tools, FormattedTools) and tools.tool_format == tool_format:
+            return tools
+        return FormattedTools(map(ToolHelper.get_formatter(tool_format), tools), tool_format=tool_format)
+    
     @staticmethod
     def infer_func_schema(func: Callable, name: Optional[str] = None) -> Type[BaseModel]:
         """
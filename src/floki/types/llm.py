@@ -1,37 +1,38 @@
-from typing import List, Union, Optional, Dict, Any, Literal, IO, Tuple
-from pydantic import BaseModel, Field, model_validator, field_validator, ConfigDict
+from typing import List, Union, Optional, Dict, Any, Literal, IO, Tuple, Annotated
+from pydantic import BaseModel, Field, model_validator, field_validator, ConfigDict, BeforeValidator
 from pydantic_core import PydanticUseDefault
 from pathlib import Path
 from io import BytesIO, BufferedReader
 
 from pydantic import BaseModel, Field
 
-class ElevenLabsClientConfig(BaseModel):
-    base_url: Literal[
+def none_to_default(v):
+    if v is None:
+        raise PydanticUseDefault()
+    return v
+
+# Marks fields whose default should apply when None is passed explicitly.
+# Only needed where the default is not None or the field type does not accept None.
+NoneAsDefault = BeforeValidator(none_to_default)
+
+class FrozenConfigModel(BaseModel):
+    """
+    Base model for read-only LLM settings. Instances are frozen once validated.
+    """
+    model_config = ConfigDict(frozen=True)
+
+class ElevenLabsClientConfig(FrozenConfigModel):
+    base_url: Annotated[Literal[
         "https://api.elevenlabs.io",
         "https://api.us.elevenlabs.io"
-        ] = Field(default="https://api.elevenlabs.io",description="Base URL for the ElevenLabs API. Defaults to the production environment.")
+        ], NoneAsDefault] = Field(default="https://api.elevenlabs.io",description="Base URL for the ElevenLabs API. Defaults to the production environment.")
     api_key: Optional[str] = Field(None, description="API key to authenticate with the ElevenLabs API.")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class NVIDIAClientConfig(BaseModel):
-    base_url: Optional[str] = Field("https://integrate.api.nvidia.com/v1", description="Base URL for the NVIDIA API")
+class NVIDIAClientConfig(FrozenConfigModel):
+    base_url: Annotated[Optional[str], NoneAsDefault] = Field("https://integrate.api.nvidia.com/v1", description="Base URL for the NVIDIA API")
     api_key: Optional[str] = Field(None, description="API key to authenticate the NVIDIA API")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class HFInferenceClientConfig(BaseModel):
+class HFInferenceClientConfig(FrozenConfigModel):
     model: Optional[str] = Field(None, description="Model ID on Hugging Face Hub or URL to a deployed Inference Endpoint. Defaults to a recommended model if not provided.")
     api_key: Optional[Union[str, bool]] = Field(None, description="Hugging Face API key for authentication. Defaults to the locally saved token. Pass False to skip token.")
     token: Optional[Union[str, bool]] = Field(None, description="Alias for api_key. Defaults to the locally saved token. Pass False to avoid sending the token.")
@@ -41,102 +42,67 @@ class HFInferenceClientConfig(BaseModel):
     cookies: Optional[Dict[str, str]] = Field(None, description="Additional cookies to send with the request.")
     proxies: Optional[Any] = Field(None, description="Proxies to use for the request.")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class OpenAIClientConfig(BaseModel):
+class OpenAIClientConfig(FrozenConfigModel):
     base_url: Optional[str] = Field(None, description="Base URL for the OpenAI API")
     api_key: Optional[str] = Field(None, description="API key to authenticate the OpenAI API")
     organization: Optional[str] = Field(None, description="Organization name for OpenAI")
     project: Optional[str] = Field(None, description="OpenAI project name.")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class AzureOpenAIClientConfig(BaseModel):
+class AzureOpenAIClientConfig(FrozenConfigModel):
     api_key: Optional[str] = Field(None, description="API key to authenticate the Azure OpenAI API")
     azure_ad_token: Optional[str] = Field(None, description="Azure Active Directory token for authentication")
     organization: Optional[str] = Field(None, description="Azure organization associated with the OpenAI resource")
     project: Optional[str] = Field(None, description="Azure project associated with the OpenAI resource")
-    api_version: Optional[str] = Field("2024-07-01-preview", description="API version for Azure OpenAI models")
+    api_version: Annotated[Optional[str], NoneAsDefault] = Field("2024-07-01-preview", description="API version for Azure OpenAI models")
     azure_endpoint: Optional[str] = Field(None, description="Azure endpoint for Azure OpenAI models")
     azure_deployment: Optional[str] = Field(default=None, description="Azure deployment for Azure OpenAI models")
     azure_client_id: Optional[str] = Field(default=None, description="Client ID for Managed Identity authentication.")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
 class OpenAIModelConfig(OpenAIClientConfig):
-    type: Literal["openai"] = Field("openai", description="Type of the model, must always be 'openai'")
-    name: str = Field(default=None, description="Name of the OpenAI model")
+    type: Annotated[Literal["openai"], NoneAsDefault] = Field("openai", description="Type of the model, must always be 'openai'")
+    name: Annotated[str, NoneAsDefault] = Field(default=None, description="Name of the OpenAI model")
 
 class AzureOpenAIModelConfig(AzureOpenAIClientConfig):
-    type: Literal["azure_openai"] = Field("azure_openai", description="Type of the model, must always be 'azure_openai'")
+    type: Annotated[Literal["azure_openai"], NoneAsDefault] = Field("azure_openai", description="Type of the model, must always be 'azure_openai'")
 
 class HFHubModelConfig(HFInferenceClientConfig):
-    type: Literal["huggingface"] = Field("huggingface", description="Type of the model, must always be 'huggingface'")
-    name: str = Field(default=None, description="Name of the model available through Hugging Face")
+    type: Annotated[Literal["huggingface"], NoneAsDefault] = Field("huggingface", description="Type of the model, must always be 'huggingface'")
+    name: Annotated[str, NoneAsDefault] = Field(default=None, description="Name of the model available through Hugging Face")
 
 class NVIDIAModelConfig(NVIDIAClientConfig):
-    type: Literal["nvidia"] = Field("nvidia", description="Type of the model, must always be 'nvidia'")
-    name: str = Field(default=None, description="Name of the model available through NVIDIA")
+    type: Annotated[Literal["nvidia"], NoneAsDefault] = Field("nvidia", description="Type of the model, must always be 'nvidia'")
+    name: Annotated[str, NoneAsDefault] = Field(default=None, description="Name of the model available through NVIDIA")
 
-class OpenAIParamsBase(BaseModel):
+class OpenAIParamsBase(FrozenConfigModel):
     """
     Common request settings for OpenAI services.
     """
     model: Optional[str] = Field(None, description="ID of the model to use")
-    temperature: Optional[float] = Field(0, ge=0.0, le=2.0, description="Sampling temperature")
+    temperature: Annotated[Optional[float], NoneAsDefault] = Field(0, ge=0.0, le=2.0, description="Sampling temperature")
     max_tokens: Optional[int] = Field(None, description="Maximum number of tokens to generate. Can be None or a positive integer.")
-    top_p: Optional[float] = Field(1.0, ge=0.0, le=1.0, description="Nucleus sampling probability mass")
-    frequency_penalty: Optional[float] = Field(0.0, ge=-2.0, le=2.0, description="Frequency penalty")
-    presence_penalty: Optional[float] = Field(0.0, ge=-2.0, le=2.0, description="Presence penalty")
+    top_p: Annotated[Optional[float], NoneAsDefault] = Field(1.0, ge=0.0, le=1.0, description="Nucleus sampling probability mass")
+    frequency_penalty: Annotated[Optional[float], NoneAsDefault] = Field(0.0, ge=-2.0, le=2.0, description="Frequency penalty")
+    presence_penalty: Annotated[Optional[float], NoneAsDefault] = Field(0.0, ge=-2.0, le=2.0, description="Presence penalty")
     stop: Optional[Union[str, List[str]]] = Field(None, description="Stop sequences")
-    stream: Optional[bool] = Field(False, description="Whether to stream responses")
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
+    stream: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Whether to stream responses")
 
 class OpenAITextCompletionParams(OpenAIParamsBase):
     """
     Specific configs for the text completions endpoint.
     """
     best_of: Optional[int] = Field(None, ge=1, description="Number of best completions to generate")
-    echo: Optional[bool] = Field(False, description="Whether to echo the prompt")
+    echo: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Whether to echo the prompt")
     logprobs: Optional[int] = Field(None, ge=0, le=5, description="Include log probabilities")
     suffix: Optional[str] = Field(None, description="Suffix to append to the prompt")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
 class OpenAIChatCompletionParams(OpenAIParamsBase):
     """
     Specific settings for the Chat Completion endpoint.
     """
     logit_bias: Optional[Dict[Union[str, int], float]] = Field(None, description="Modify likelihood of specified tokens")
-    logprobs: Optional[bool] = Field(False, description="Whether to return log probabilities")
+    logprobs: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Whether to return log probabilities")
     top_logprobs: Optional[int] = Field(None, ge=0, le=20, description="Number of top log probabilities to return")
-    n: Optional[int] = Field(1, ge=1, le=128, description="Number of chat completion choices to generate")
+    n: Annotated[Optional[int], NoneAsDefault] = Field(1, ge=1, le=128, description="Number of chat completion choices to generate")
     response_format: Optional[Dict[Literal["type"], Literal["text", "json_object"]]] = Field(None, description="Format of the response")
     tools: Optional[List[Dict[str, Any]]] = Field(None, max_length=64, description="List of tools the model may call")
     tool_choice: Optional[Union[str, Dict[str, Any]]] = Field(None, description="Controls which tool is called")
@@ -144,134 +110,127 @@ class OpenAIChatCompletionParams(OpenAIParamsBase):
     seed: Optional[int] = Field(None, description="Seed for deterministic sampling")
     user: Optional[str] = Field(None, description="Unique identifier representing the end-user")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class HFHubChatCompletionParams(BaseModel):
+class HFHubChatCompletionParams(FrozenConfigModel):
     """
     Specific settings for Hugging Face Hub Chat Completion endpoint.
     """
     model: Optional[str] = Field(None, description="The model to use for chat-completion. Can be a model ID or a URL to a deployed Inference Endpoint.")
-    frequency_penalty: Optional[float] = Field(0.0, description="Penalizes new tokens based on their existing frequency in the text so far.")
+    frequency_penalty: Annotated[Optional[float], NoneAsDefault] = Field(0.0, description="Penalizes new tokens based on their existing frequency in the text so far.")
     logit_bias: Optional[Dict[Union[str, int], float]] = Field(None, description="Modify the likelihood of specified tokens appearing in the completion.")
-    logprobs: Optional[bool] = Field(False, description="Whether to return log probabilities of the output tokens or not.")
-    max_tokens: Optional[int] = Field(100, ge=1, description="Maximum number of tokens allowed in the response.")
+    logprobs: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Whether to return log probabilities of the output tokens or not.")
+    max_tokens: Annotated[Optional[int], NoneAsDefault] = Field(100, ge=1, description="Maximum number of tokens allowed in the response.")
     n: Optional[int] = Field(None, description="UNUSED. Included for compatibility.")
-    presence_penalty: Optional[float] = Field(0.0, description="Penalizes new tokens based on their presence in the text so far.")
+    presence_penalty: Annotated[Optional[float], NoneAsDefault] = Field(0.0, description="Penalizes new tokens based on their presence in the text so far.")
     response_format: Optional[Union[Dict[str, Any], str]] = Field(None, description="Grammar constraints. Can be either a JSONSchema or a regex.")
     seed: Optional[int] = Field(None, description="Seed for reproducible control flow.")
     stop: Optional[Union[str, List[str]]] = Field(None, description="Up to four strings which trigger the end of the response.")
-    stream: Optional[bool] = Field(False, description="Enable realtime streaming of responses.")
+    stream: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Enable realtime streaming of responses.")
     stream_options: Optional[Dict[str, Any]] = Field(None, description="Options for streaming completions.")
-    temperature: Optional[float] = Field(1.0, description="Controls randomness of the generations.")
+    temperature: Annotated[Optional[float], NoneAsDefault] = Field(1.0, description="Controls randomness of the generations.")
     top_logprobs: Optional[int] = Field(None, description="Number of most likely tokens to return at each position.")
     top_p: Optional[float] = Field(None, description="Fraction of the most likely next words to sample from.")
     tool_choice: Optional[Union[str, Dict[str, Any]]] = Field(None, description="The tool to use for the completion. Defaults to 'auto'.")
     tool_prompt: Optional[str] = Field(None, description="A prompt to be appended before the tools.")
     tools: Optional[List[Dict[str, Any]]] = Field(None, description="A list of tools the model may call.")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
 class NVIDIAChatCompletionParams(OpenAIParamsBase):
     """
     Specific settings for the Chat Completion endpoint.
     """
     logit_bias: Optional[Dict[Union[str, int], float]] = Field(None, description="Modify likelihood of specified tokens")
-    logprobs: Optional[bool] = Field(False, description="Whether to return log probabilities")
+    logprobs: Annotated[Optional[bool], NoneAsDefault] = Field(False, description="Whether to return log probabilities")
     top_logprobs: Optional[int] = Field(None, ge=0, le=20, description="Number of top log probabilities to return")
-    n: Optional[int] = Field(1, ge=1, le=128, description="Number of chat completion choices to generate")
+    n: Annotated[Optional[int], NoneAsDefault] = Field(1, ge=1, le=128, description="Number of chat completion choices to generate")
     tools: Optional[List[Dict[str, Any]]] = Field(None, max_length=64, description="List of tools the model may call")
     tool_choice: Optional[Union[str, Dict[str, Any]]] = Field(None, description="Controls which tool is called")
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
-
-class PromptyModelConfig(BaseModel):
-    api: Literal["chat", "completion"] = Field("chat", description="The API to use, either 'chat' or 'completion'")
+# Model configuration class for each configuration 'type' found in a Prompty definition
+_CONFIG_BY_TYPE = {
+    "openai": OpenAIModelConfig,
+    "azure_openai": AzureOpenAIModelConfig,
+    "huggingface": HFHubModelConfig,
+    "nvidia": NVIDIAModelConfig,
+}
+
+# Request parameters class expected by each model configuration class
+_PARAMS_BY_CONFIG_CLASS = {
+    OpenAIModelConfig: OpenAIChatCompletionParams,
+    AzureOpenAIModelConfig: OpenAIChatCompletionParams,
+    HFHubModelConfig: HFHubChatCompletionParams,
+    NVIDIAModelConfig: NVIDIAChatCompletionParams,
+}
+
+class PromptyModelConfig(FrozenConfigModel):
+    api: Annotated[Literal["chat", "completion"], NoneAsDefault] = Field("chat", description="The API to use, either 'chat' or 'completion'")
     configuration: Union[OpenAIModelConfig, AzureOpenAIModelConfig, HFHubModelConfig, NVIDIAModelConfig] = Field(..., description="Model configuration settings")
     parameters: Union[OpenAITextCompletionParams, OpenAIChatCompletionParams, HFHubChatCompletionParams, NVIDIAChatCompletionParams] = Field(..., description="Parameters for the model request")
-    response: Literal["first", "full"] = Field("first", description="Determines if full response or just the first one is returned")
-
-    @field_validator("*", mode="before")
-    @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
+    response: Annotated[Literal["first", "full"], NoneAsDefault] = Field("first", description="Determines if full response or just the first one is returned")
     
     @model_validator(mode='before')
+    @classmethod
     def sync_model_name(cls, values: dict):
         """
         Ensure that the parameters model name matches the configuration model name.
+
+        This runs before field validation because the parameters class depends on the configuration type,
+        which the parameters union cannot infer on its own. Instances built here are validated exactly once
+        and are accepted as-is by the field validation that follows.
         """
         configuration = values.get('configuration')
         parameters = values.get('parameters')
 
         # Ensure the 'configuration' is properly validated as a model, not a dict
         if isinstance(configuration, dict):
-            if configuration.get("type") == "openai":
-                configuration = OpenAIModelConfig(**configuration)
-            elif configuration.get("type") == "azure_openai":
-                configuration = AzureOpenAIModelConfig(**configuration)
-            elif configuration.get("type") == "huggingface":
-                configuration = HFHubModelConfig(**configuration)
-            elif configuration.get("type") == "nvidia":
-                configuration = NVIDIAModelConfig(**configuration)
+            config_class = _CONFIG_BY_TYPE.get(configuration.get("type"))
+            if config_class:
+                configuration = config_class.model_validate(configuration)
 
         # Ensure 'parameters' is properly validated as a model, not a dict
-        if isinstance(parameters, dict):
-            if configuration and isinstance(configuration, OpenAIModelConfig):
-                parameters = OpenAIChatCompletionParams(**parameters)
-            elif configuration and isinstance(configuration, AzureOpenAIModelConfig):
-                parameters = OpenAIChatCompletionParams(**parameters)
-            elif configuration and isinstance(configuration, HFHubModelConfig):
-                parameters = HFHubChatCompletionParams(**parameters)
-            elif configuration and isinstance(configuration, NVIDIAModelConfig):
-                parameters = NVIDIAChatCompletionParams(**parameters)
+        if isinstance(parameters, dict) and configuration:
+            params_class = next(
+                (_PARAMS_BY_CONFIG_CLASS[base] for base in type(configuration).__mro__ if base in _PARAMS_BY_CONFIG_CLASS),
+                None,
+            )
+            if params_class:
+                parameters = params_class.model_validate(parameters)
 
         if configuration and parameters:
             # Check if 'name' or 'azure_deployment' is explicitly set
+            # Parameters are frozen, so the model name is applied to a copy
             if "name" in configuration.model_fields_set:
-                parameters.model = configuration.name
+                parameters = parameters.model_copy(update={"model": configuration.name})
             elif "azure_deployment" in configuration.model_fields_set:
-                parameters.model = configuration.azure_deployment
+                parameters = parameters.model_copy(update={"model": configuration.azure_deployment})
 
         values['configuration'] = configuration
         values['parameters'] = parameters
         return values
 
-class PromptyDefinition(BaseModel):
+class PromptyDefinition(FrozenConfigModel):
     """Schema for a Prompty definition."""
-    name: Optional[str] = Field("", description="Name of the Prompty file.")
-    description: Optional[str] = Field("", description="Description of the Prompty file.")
-    version: Optional[str] = Field("1.0", description="Version of the Prompty.")
-    authors: Optional[List[str]] = Field([], description="List of authors for the Prompty.")
-    tags: Optional[List[str]] = Field([], description="Tags to categorize the Prompty.")
+    name: Annotated[Optional[str], NoneAsDefault] = Field("", description="Name of the Prompty file.")
+    description: Annotated[Optional[str], NoneAsDefault] = Field("", description="Description of the Prompty file.")
+    version: Annotated[Optional[str], NoneAsDefault] = Field("1.0", description="Version of the Prompty.")
+    authors: Annotated[Optional[List[str]], NoneAsDefault] = Field([], description="List of authors for the Prompty.")
+    tags: Annotated[Optional[List[str]], NoneAsDefault] = Field([], description="Tags to categorize the Prompty.")
     model: PromptyModelConfig = Field(..., description="Model configuration. Can be either OpenAI or Azure OpenAI.")
-    inputs: Dict[str, Any] = Field({}, description="Input parameters for the Prompty. These define the expected inputs.")
+    inputs: Annotated[Dict[str, Any], NoneAsDefault] = Field({}, description="Input parameters for the Prompty. These define the expected inputs.")
     sample: Optional[Union[Dict[str, Any], str]] = Field(None, description="Sample input or the path to a sample file for testing the Prompty.")
-    outputs: Optional[Dict[str, Any]] = Field({}, description="Optional outputs for the Prompty. Defines expected output format.")
+    outputs: Annotated[Optional[Dict[str, Any]], NoneAsDefault] = Field({}, description="Optional outputs for the Prompty. Defines expected output format.")
     content: str = Field(..., description="The prompt messages defined in the Prompty file.")
 
-    @field_validator("*", mode="before")
     @classmethod
-    def none_to_default(cls, v):
-        if v is None:
-            raise PydanticUseDefault()
-        return v
+    def from_json(cls, data: Union[str, bytes]):
+        """
+        Create a Prompty definition from a JSON document, parsing and validating it in a single pass.
+
+        Args:
+            data (Union[str, bytes]): The serialized Prompty definition.
+
+        Returns:
+            PromptyDefinition: A validated instance of the calling class.
+        """
+        return cls.model_validate_json(data)
 
 class AudioSpeechRequest(BaseModel):
     model: Optional[Literal["tts-1", "tts-1-hd"]] = Field("tts-1", description="TTS model to use. Defaults to 'tts-1'.")
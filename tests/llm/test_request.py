@@ -0,0 +1,76 @@
+import gc
+import weakref
+
+from pydantic import Field, computed_field, create_model, field_serializer
+
+from floki.llm.utils.request import _freeze_inputs, normalize_chat_messages, process_prompty_messages
+from floki.prompt.prompty import Prompty
+from floki.types.message import UserMessage
+
+PROMPTY = """---
+name: Echo
+model:
+  api: completion
+  configuration:
+    type: openai
+    name: gpt-4o
+  parameters:
+    max_tokens: 10
+inputs: {}
+sample: {}
+---
+Value: {{n}}
+"""
+
+
+def test_freeze_inputs_skips_containers():
+    assert _freeze_inputs({"n": (1,)}) is None
+    assert _freeze_inputs({"n": [1]}) is None
+
+
+def test_freeze_inputs_distinguishes_equal_scalars():
+    keys = {_freeze_inputs({"n": value}) for value in (1, True, 1.0)}
+    assert len(keys) == 3
+
+
+def test_freeze_inputs_tolerates_mixed_key_types():
+    assert _freeze_inputs({1: "a", "b": "c"}) is not None
+
+
+def test_prompty_renders_equal_nested_values_distinctly():
+    prompty = Prompty.load(PROMPTY)
+    rendered = [process_prompty_messages(prompty, {"n": value}) for value in ((1,), (True,), (1.0,))]
+    assert rendered == ["Value: (1,)", "Value: (True,)", "Value: (1.0,)"]
+
+
+class TracedUserMessage(UserMessage):
+    trace_id: str = Field(default="t-1", exclude=True)
+
+    @field_serializer("content")
+    def shout(self, content: str) -> str:
+        return content.upper()
+
+    @computed_field
+    @property
+    def length(self) -> int:
+        return len(self.content)
+
+
+def test_normalize_matches_model_dump_for_flat_messages():
+    message = UserMessage(content="hi")
+    assert normalize_chat_messages([message]) == [message.model_dump()]
+
+
+def test_normalize_uses_serializer_for_customized_messages():
+    message = TracedUserMessage(content="hi")
+    assert normalize_chat_messages([message]) == [message.model_dump()]
+
+
+def test_dynamic_message_classes_can_be_garbage_collected():
+    message_class = create_model("DynamicMessage", __base__=UserMessage)
+    normalize_chat_messages([message_class(content="hi")])
+    ref = weakref.ref(message_class)
+    del message_class
+    gc.collect()
+
+    assert ref() is None
@@ -0,0 +1,52 @@
+import copy
+import gc
+import weakref
+
+import pytest
+
+from floki.tool.utils import tool as tool_utils
+from floki.tool.utils.tool import FormattedTools, ToolHelper
+
+
+def make_tool(name: str):
+    def lookup(city: str) -> str:
+        """Look up a city."""
+        return f"{name}:{city}"
+    return lookup
+
+
+def test_format_tool_reuses_cached_definition():
+    func = make_tool("cached")
+    first = ToolHelper.format_tool(func, tool_format="openai")
+    second = ToolHelper.format_tool(func, tool_format="openai")
+
+    assert first == second
+    assert first is not second
+    assert first["function"]["name"] == "Lookup"
+
+
+def test_formatted_closures_can_be_garbage_collected():
+    refs = []
+    for i in range(50):
+        func = make_tool(str(i))
+        ToolHelper.format_tool(func, tool_format="openai")
+        assert func in tool_utils._FUNCTION_FORMATS
+        refs.append(weakref.ref(func))
+    del func
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
+
+
+def test_formatted_tools_require_an_explicit_format():
+    with pytest.raises(TypeError):
+        FormattedTools([{"type": "function"}])
+
+
+def test_format_tools_tags_and_copies_with_format():
+    tools = ToolHelper.format_tools([make_tool("tagged")], tool_format="openai")
+    copied = copy.deepcopy(tools)
+
+    assert tools.tool_format == "openai"
+    assert isinstance(copied, FormattedTools)
+    assert copied == tools and copied.tool_format == "openai"